@@ -1,19 +1,20 @@
 """SDK for the https://publit.io RESTful API."""
 
-import secrets
 import hashlib
-import calendar
-import functools
-import os.path
-from datetime import datetime
+import os
+import time
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __all__ = [
     'UnknownStatusCode',
     'TransformationFailed',
     'BadJSON',
-    'PublitioAPI'
+    'PublitioAPI',
+    'AsyncPublitioAPI'
 ]
 
 
@@ -48,22 +49,25 @@ class BadJSON(Exception):
 
 
 def generate_nonce():
-    x = secrets.randbelow(100000000 - 10000000) + 10000000
+    x = int.from_bytes(os.urandom(4), 'big') % 90000000 + 10000000
     return str(x)
 
 
 def current_unix_timestamp():
-    return str(calendar.timegm(datetime.utcnow().utctimetuple()))
+    return str(int(time.time()))
+
+
+_KNOWN_STATUS_CODES = frozenset(range(200, 300)) \
+                      | frozenset(range(400, 407)) \
+                      | {410, 422, 429, 500, 503}
 
 
 def status_code_is_known(status_code):
-    return 200 <= status_code < 300 \
-           or 400 <= status_code <= 406 \
-           or status_code in [410, 422, 429, 500, 503]
+    return status_code in _KNOWN_STATUS_CODES
 
 
 def check_status_code(status_code):
-    if not status_code_is_known(status_code):
+    if status_code not in _KNOWN_STATUS_CODES:
         raise UnknownStatusCode(status_code)
 
 
@@ -77,6 +81,8 @@ def rest_request(method, *args, **kwargs):
     res = method(*args, **kwargs)
     check_status_code(res.status_code)
     try:
+        if orjson is not None:
+            return orjson.loads(res.content)
         return res.json()
     except Exception:
         raise BadJSON(res.text)
@@ -94,26 +100,106 @@ def replace_extension(filename, new_extension):
                           new_extension)
 
 
-rest_get = functools.partial(rest_request, requests.get)
-rest_put = functools.partial(rest_request, requests.put)
-rest_post = functools.partial(rest_request, requests.post)
-rest_delete = functools.partial(rest_request, requests.delete)
+def query_params(params):
+    # Match requests, which drops None values and sends the rest as str.
+    # Used for transports which encode values differently.
+    return {k: str(v) for k, v in params.items() if v is not None}
 
 
-class PublitioAPI:
-    """This class is the main interface to the Publitio RESTful API.
+def response_reason(response):
+    # requests calls the status text reason, httpx calls it reason_phrase.
+    reason = getattr(response, 'reason', None)
+    return response.reason_phrase if reason is None else reason
 
-    It contains methods matching all API endpoints.
-    For a list of endpoints, see https://publit.io/docs.
-    Each method returns a dict of parsed server JSON response, except
-    transformed which returns raw bytes of retrieved file.
-    Each method supports keyword parameters.
-    For the transformed method, these correspond to transformation parameters,
-    such as w=300 to set image width to 300.
-    For the other methods, these correspond to query parameters. For example,
-    calling publitio_api.list_files(limit=10) will list 10 files at most.
-    Make sure to check https://publit.io/docs to see which parameters
-    are supported for each API endpoint.
+
+def upload_filename(file, default):
+    # Same rules as requests' guess_filename: temporary files may have an
+    # int or None name, and names like <stdin> are not real filenames.
+    name = getattr(file, 'name', None)
+    if isinstance(name, os.PathLike):
+        name = os.fspath(name)
+    if isinstance(name, str) and name and name[0] != '<' and name[-1] != '>':
+        return os.path.basename(name)
+    return default
+
+
+def streamable(file):
+    # MultipartEncoder needs the length of the body up front, which it can
+    # only work out reliably for seekable files.
+    seekable = getattr(file, 'seekable', None)
+    return seekable is not None and seekable()
+
+
+def multipart_encoder(files):
+    from requests_toolbelt import MultipartEncoder
+
+    fields = {
+        name: (upload_filename(file, name), file, 'application/octet-stream')
+        for name, file in files.items()
+    }
+    return MultipartEncoder(fields=fields)
+
+
+def httpx_files(files):
+    # httpx streams file objects, but it trusts their name and needs to know
+    # their length, so name them like requests and read non-seekable streams.
+    return {
+        name: (upload_filename(file, name),
+               file if streamable(file) else file.read(),
+               'application/octet-stream')
+        for name, file in files.items()
+    }
+
+
+# HTTP libraries are imported lazily, so that building transformation URLs
+# does not pay for importing them. The same goes for concurrent.futures
+# and asyncio, which are only needed by the bulk methods.
+def pooled_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2,
+                          pool_maxsize=16,
+                          max_retries=Retry(total=3,
+                                            backoff_factor=0.2,
+                                            status_forcelist=[429, 500, 503],
+                                            raise_on_status=False))
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def http2_client():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError('HTTP/2 support requires httpx. '
+                          'Install it with pip3 install publitio[http2].')
+
+    return httpx.Client(http2=True,
+                        limits=httpx.Limits(max_keepalive_connections=8,
+                                            max_connections=32),
+                        timeout=30.0,
+                        follow_redirects=True)
+
+
+def aiohttp_session():
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=32,
+                                     ttl_dns_cache=300,
+                                     keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class _PublitioBase:
+    """Request signing and endpoint methods shared by the API classes.
+
+    Endpoint methods return whatever the subclass's _api_get, _api_put,
+    _api_post and _api_delete return, so the same methods serve both the
+    blocking PublitioAPI and the coroutine based AsyncPublitioAPI.
     """
 
     _API_URL = 'https://api.publit.io/v1/'
@@ -127,55 +213,51 @@ class PublitioAPI:
         """
         self.key = key
         self.secret = secret
+        self._api_url = self._API_URL
+
+    @property
+    def key(self):
+        """API key used to sign requests."""
+        return self._payload_template['api_key']
+
+    @key.setter
+    def key(self, key):
+        self._payload_template = {
+            'api_key': key,
+            'api_kit': 'python3-' + VERSION
+        }
+
+    @property
+    def secret(self):
+        """API secret used to sign requests."""
+        return self._secret
+
+    @secret.setter
+    def secret(self, secret):
+        self._secret = secret
+        self._secret_bytes = secret.encode()
 
     def _generate_signature(self, timestamp, nonce):
-        s = timestamp + nonce + self.secret
-        sha1_hash = hashlib.sha1(s.encode())
-        digest = sha1_hash.hexdigest()
-        return str(digest)
+        message = (timestamp + nonce).encode('ascii') + self._secret_bytes
+        return hashlib.sha1(message).digest().hex()
 
     def _api_payload(self):
         timestamp = current_unix_timestamp()
         nonce = generate_nonce()
         signature = self._generate_signature(timestamp, nonce)
 
-        return {
-            'api_key': self.key,
-            'api_timestamp': timestamp,
-            'api_nonce': nonce,
-            'api_signature': signature,
-            'api_kit': 'python3-' + VERSION
-        }
+        payload = self._payload_template.copy()
+        payload['api_timestamp'] = timestamp
+        payload['api_nonce'] = nonce
+        payload['api_signature'] = signature
+        return payload
 
     def _full_payload(self, user_payload):
         result = self._api_payload()
-        result.update(user_payload)
+        if user_payload:
+            result.update(user_payload)
         return result
 
-    def _api_get(self, path, payload=None):
-        return rest_get(PublitioAPI._API_URL + path,
-                        params=self._full_payload(payload or {}))
-
-    def _api_put(self, path, payload=None, data=None):
-        payload = payload or {}
-        data = data or {}
-
-        return rest_put(PublitioAPI._API_URL + path,
-                        params=self._full_payload(payload),
-                        data=data)
-
-    def _api_post(self, path, payload=None, data=None):
-        payload = payload or {}
-        data = data or {}
-
-        return rest_post(PublitioAPI._API_URL + path,
-                         params=self._full_payload(payload),
-                         files=data)
-
-    def _api_delete(self, path):
-        return rest_delete(PublitioAPI._API_URL + path,
-                           params=self._api_payload())
-
     def create_file(self, file=None, **params):
         """Create (upload) a new file.
 
@@ -344,14 +426,148 @@ class PublitioAPI:
 
     @staticmethod
     def _transformation_options(**params):
-        return ','.join('{}_{}'.format(k, v) for k, v in params.items())
+        return ','.join([f'{k}_{v}' for k, v in params.items()])
 
     @staticmethod
     def _transformation_url(filename, *, extension=None, **params):
         filename = replace_extension(filename, extension)
-        options = PublitioAPI._transformation_options(**params)
+        options = _PublitioBase._transformation_options(**params)
+        options_url = options + '/' if options else ''
+        return ''.join((_PublitioBase._MEDIA_URL, 'file/', options_url,
+                        filename))
+
+    @staticmethod
+    def transform_url_builder(*, extension=None, **fixed):
+        """Return a function which builds transformation URLs.
+
+        The returned function takes a filename and returns the URL the
+        transformed method would fetch for it, with the given extension and
+        the fixed transformation parameters. The fixed parameters are
+        formatted only once, which helps when building many URLs with the
+        same transformation. The returned function also accepts an extension
+        and extra keyword transformation parameters, which override the
+        fixed ones. This is a static method, so it can be called on the
+        class without creating an API object or its HTTP session.
+        """
+        options = _PublitioBase._transformation_options(**fixed)
         options_url = options + '/' if options else ''
-        return PublitioAPI._MEDIA_URL + 'file/' + options_url + filename
+        prefix = ''.join((_PublitioBase._MEDIA_URL, 'file/', options_url))
+        fixed_extension = extension
+
+        def build(filename, *, extension=fixed_extension, **params):
+            if params:
+                return _PublitioBase._transformation_url(
+                    filename, extension=extension, **{**fixed, **params})
+            return prefix + replace_extension(filename, extension)
+
+        return build
+
+
+class PublitioAPI(_PublitioBase):
+    """This class is the main interface to the Publitio RESTful API.
+
+    It contains methods matching all API endpoints.
+    For a list of endpoints, see https://publit.io/docs.
+    Each method returns a dict of parsed server JSON response, except
+    transformed which returns raw bytes of retrieved file.
+    Each method supports keyword parameters.
+    For the transformed method, these correspond to transformation parameters,
+    such as w=300 to set image width to 300.
+    For the other methods, these correspond to query parameters. For example,
+    calling publitio_api.list_files(limit=10) will list 10 files at most.
+    Make sure to check https://publit.io/docs to see which parameters
+    are supported for each API endpoint.
+    All requests go through a single pooled HTTP session, so consecutive
+    calls reuse the same connection. Call close when done, or use the
+    API object as a context manager: with PublitioAPI(...) as api.
+    """
+
+    def __init__(self, key, secret, *, http2=False):
+        """Create API interface with given API key and API secret.
+
+        You may find your API key and secret at the
+        Publitio dashboard: https://publit.io/dashboard.
+        Pass http2=True to send requests over HTTP/2 with httpx, which
+        multiplexes concurrent calls over a single connection. This requires
+        httpx, installed with pip3 install publitio[http2].
+        """
+        super().__init__(key, secret)
+        self._http2 = http2
+        self._session = http2_client() if http2 else pooled_session()
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _params(self, payload):
+        params = self._full_payload(payload)
+        # httpx sends True as true and None as an empty value, unlike requests.
+        return query_params(params) if self._http2 else params
+
+    def _api_get(self, path, payload=None):
+        return rest_request(self._session.get,
+                            f'{self._api_url}{path}',
+                            params=self._params(payload))
+
+    def _api_put(self, path, payload=None, data=None):
+        if data and self._http2:
+            data = query_params(data)
+
+        return rest_request(self._session.put,
+                            f'{self._api_url}{path}',
+                            params=self._params(payload),
+                            data=data)
+
+    def _api_post(self, path, payload=None, data=None):
+        if not data:
+            return rest_request(self._session.post,
+                                f'{self._api_url}{path}',
+                                params=self._params(payload))
+
+        if self._http2:
+            return rest_request(self._session.post,
+                                f'{self._api_url}{path}',
+                                params=self._params(payload),
+                                files=httpx_files(data))
+
+        # MultipartEncoder cannot tell the length of non-seekable streams,
+        # so let requests read those into memory.
+        if not all(map(streamable, data.values())):
+            return rest_request(self._session.post,
+                                f'{self._api_url}{path}',
+                                params=self._params(payload),
+                                files=data)
+
+        # Stream seekable files instead of reading them into memory.
+        encoder = multipart_encoder(data)
+        return rest_request(self._session.post,
+                            f'{self._api_url}{path}',
+                            params=self._params(payload),
+                            data=encoder,
+                            headers={'Content-Type': encoder.content_type})
+
+    def _api_delete(self, path):
+        return rest_request(self._session.delete,
+                            f'{self._api_url}{path}',
+                            params=self._api_payload())
+
+    def delete_files(self, file_ids, max_workers=8):
+        """Permanently delete all files with IDs in file_ids concurrently.
+
+        Returns a list of results in the same order as file_ids.
+        The requests are sent by up to max_workers threads sharing this
+        API object's connection pool.
+        """
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(self.delete_file, file_ids))
 
     def transformed(self, filename, *, extension=None, **params):
         """Transform a media file from the server and retrieve the new version.
@@ -365,8 +581,155 @@ class PublitioAPI:
         url = PublitioAPI._transformation_url(filename,
                                               extension=extension,
                                               **params)
+        return self._fetch_transformed(url)
+
+    def transformed_many(self, specs, max_workers=8):
+        """Transform and retrieve many media files concurrently.
+
+        specs should be an iterable of (filename, extension, params) tuples,
+        where extension may be None and params is a dict of transformation
+        parameters, as they would be passed to transformed. Returns a list
+        of raw bytes of the retrieved files, in the same order as specs.
+        The files are fetched by up to max_workers threads sharing this
+        API object's connection pool.
+        """
+        urls = [PublitioAPI._transformation_url(filename,
+                                                extension=extension,
+                                                **params)
+                for filename, extension, params in specs]
+
+        import concurrent.futures
 
-        res = requests.get(url)
-        if not res.ok:
-            raise TransformationFailed(res.reason)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(self._fetch_transformed, urls))
+
+    def _fetch_transformed(self, url):
+        res = self._session.get(url)
+        if res.status_code >= 400:
+            raise TransformationFailed(response_reason(res))
         return res.content
+
+
+class AsyncPublitioAPI(_PublitioBase):
+    """Asynchronous interface to the Publitio RESTful API.
+
+    It has the same methods as PublitioAPI, except that each of them is a
+    coroutine, so many API calls can run concurrently on one event loop.
+    delete_files and transformed_many take no max_workers argument, since
+    their concurrency is bounded by the session's connection pool instead.
+    This class requires aiohttp, installed with pip3 install publitio[async].
+    All calls share a single aiohttp session, created on first use.
+    Close it with close, or use the API object as an asynchronous
+    context manager: async with AsyncPublitioAPI(...) as api.
+    """
+
+    def __init__(self, key, secret):
+        """Create API interface with given API key and API secret.
+
+        You may find your API key and secret at the
+        Publitio dashboard: https://publit.io/dashboard.
+        """
+        # Fail early rather than on the first request.
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise ImportError('AsyncPublitioAPI requires aiohttp. '
+                              'Install it with pip3 install publitio[async].')
+        super().__init__(key, secret)
+        self._session = None
+
+    def _client_session(self):
+        if self._session is None:
+            self._session = aiohttp_session()
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        self._client_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _api_request(self, method, path, params, data=None):
+        async with self._client_session().request(
+                method, f'{self._api_url}{path}',
+                params=query_params(params), data=data) as res:
+            check_status_code(res.status)
+            try:
+                if orjson is not None:
+                    return orjson.loads(await res.read())
+                return await res.json(content_type=None)
+            except Exception:
+                raise BadJSON(await res.text())
+
+    async def _api_get(self, path, payload=None):
+        return await self._api_request('GET', path,
+                                       self._full_payload(payload))
+
+    async def _api_put(self, path, payload=None, data=None):
+        return await self._api_request('PUT', path,
+                                       self._full_payload(payload),
+                                       data=data or None)
+
+    async def _api_post(self, path, payload=None, data=None):
+        return await self._api_request('POST', path,
+                                       self._full_payload(payload),
+                                       data=data or None)
+
+    async def _api_delete(self, path):
+        return await self._api_request('DELETE', path, self._api_payload())
+
+    async def gather_show_files(self, file_ids):
+        """Get info about all files with IDs in file_ids concurrently.
+
+        Returns a list of results in the same order as file_ids.
+        """
+        import asyncio
+
+        return await asyncio.gather(*(self.show_file(file_id)
+                                      for file_id in file_ids))
+
+    async def delete_files(self, file_ids):
+        """Permanently delete all files with IDs in file_ids concurrently.
+
+        Returns a list of results in the same order as file_ids.
+        """
+        import asyncio
+
+        return await asyncio.gather(*(self.delete_file(file_id)
+                                      for file_id in file_ids))
+
+    async def transformed_many(self, specs):
+        """Transform and retrieve many media files concurrently.
+
+        specs should be an iterable of (filename, extension, params) tuples,
+        as for PublitioAPI.transformed_many. Returns a list of raw bytes of
+        the retrieved files, in the same order as specs.
+        """
+        import asyncio
+
+        return await asyncio.gather(*(self.transformed(filename,
+                                                       extension=extension,
+                                                       **params)
+                                      for filename, extension, params
+                                      in specs))
+
+    async def transformed(self, filename, *, extension=None, **params):
+        """Transform a media file from the server and retrieve the new version.
+
+        This is the asynchronous counterpart of PublitioAPI.transformed.
+        """
+        url = AsyncPublitioAPI._transformation_url(filename,
+                                                   extension=extension,
+                                                   **params)
+
+        async with self._client_session().get(url) as res:
+            if not res.ok:
+                raise TransformationFailed(res.reason)
+            return await res.read()
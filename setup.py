@@ -2,13 +2,18 @@ import setuptools
 
 setuptools.setup(
     name='publitio',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(include=['publitio', 'publitio.*']),
     version='1.3.1',
     description='A Python SDK for https://publit.io',
     author='Enn Michael',
     author_email='enntheprogrammer@gmail.com',
     url='https://github.com/ennmichael/publitio-python-sdk',
-    install_requires=['requests'],
+    install_requires=['requests', 'requests-toolbelt'],
+    extras_require={
+        'async': ['aiohttp'],
+        'http2': ['httpx[http2]'],
+        'orjson': ['orjson']
+    },
     keywords=['publitio'],
     classifiers=[
         'Programming Language :: Python :: 3',